@@ -1,6 +1,7 @@
 import argparse
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -128,7 +129,24 @@ def run_planning_workflow(
     return wf.run(enable_summarization=True)
 
 
-def run_react(utterance_file, react_llm_model_id, workflow="pr", generate_steps_only=False, reverse=False):
+def _run_utterances(data, process_utterance, max_workers=1):
+    """Run one utterance handler over all utterances.
+
+    Planning calls are independent and spend almost all of their time
+    waiting on the LLM, so with max_workers > 1 they are fired
+    concurrently from a thread pool; max_workers=1 keeps the serial
+    behaviour.
+    """
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(process_utterance, data))
+    else:
+        for utterance in data:
+            process_utterance(utterance)
+
+
+def run_react(utterance_file, react_llm_model_id, workflow="pr", generate_steps_only=False, reverse=False,
+              max_workers=1):
     # Load the JSON data from the file
     with open(utterance_file, "r") as json_file:
         data = json.load(json_file)
@@ -139,7 +157,7 @@ def run_react(utterance_file, react_llm_model_id, workflow="pr", generate_steps_
     folder = "./trajectory/ReactAgent"
     os.makedirs(folder, exist_ok=True)
 
-    for utterance in data:
+    def process_utterance(utterance):
         print(
             f"ID: {utterance['id']}, Text: {utterance['text']}, model: {react_llm_model_id}, ReactAgent..."
         )
@@ -147,7 +165,7 @@ def run_react(utterance_file, react_llm_model_id, workflow="pr", generate_steps_
 
         if os.path.exists(trajectory_file):
             print(f"Skipping {utterance['id']}")
-            continue
+            return
 
         ans = run_planning_workflow(
             utterance["text"],
@@ -158,15 +176,18 @@ def run_react(utterance_file, react_llm_model_id, workflow="pr", generate_steps_
         )
 
         if generate_steps_only:
-            continue
+            return
 
         output = {"id": utterance["id"], "text": utterance["text"], "trajectory": ans}
 
         with open(trajectory_file, "w") as file:
             json.dump(output, file, indent=4)
 
+    _run_utterances(data, process_utterance, max_workers=max_workers)
+
 
-def run_react_reflect(utterance_file, react_llm_model_id, workflow="pr", generate_steps_only=False, reverse=False):
+def run_react_reflect(utterance_file, react_llm_model_id, workflow="pr", generate_steps_only=False, reverse=False,
+                      max_workers=1):
     # Load the JSON data from the file
     with open(utterance_file, "r") as json_file:
         data = json.load(json_file)
@@ -177,7 +198,7 @@ def run_react_reflect(utterance_file, react_llm_model_id, workflow="pr", generat
     folder = "./trajectory/ReactReflectAgent"
     os.makedirs(folder, exist_ok=True)
 
-    for utterance in data:
+    def process_utterance(utterance):
         print(
             f"ID: {utterance['id']}, Text: {utterance['text']}, model: {react_llm_model_id}, ReactReflectAgent..."
         )
@@ -185,7 +206,7 @@ def run_react_reflect(utterance_file, react_llm_model_id, workflow="pr", generat
 
         if os.path.exists(trajectory_file):
             print(f"Skipping {utterance['id']}")
-            continue
+            return
 
         ans = run_planning_workflow_with_reflection(
             utterance["text"],
@@ -196,13 +217,15 @@ def run_react_reflect(utterance_file, react_llm_model_id, workflow="pr", generat
         )
 
         if generate_steps_only:
-            continue
+            return
 
         output = {"id": utterance["id"], "text": utterance["text"], "trajectory": ans}
 
         with open(trajectory_file, "w") as file:
             json.dump(output, file, indent=4)
 
+    _run_utterances(data, process_utterance, max_workers=max_workers)
+
 
 if __name__ == "__main__":
     # with ThreadPoolExecutor(max_workers=4) as executor:
@@ -216,6 +239,7 @@ if __name__ == "__main__":
     parser.add_argument("--workflow", type=str, choices=["p", "pr"], default="pr")
     parser.add_argument("--generate_steps_only", type=bool, default=False)
     parser.add_argument("--reverse", type=bool, default=False)
+    parser.add_argument("--max_workers", type=int, default=1)
 
     args = parser.parse_args()
 
@@ -225,7 +249,8 @@ if __name__ == "__main__":
             args.llm,
             workflow=args.workflow,
             generate_steps_only=args.generate_steps_only,
-            reverse=args.reverse
+            reverse=args.reverse,
+            max_workers=args.max_workers,
         )
     elif args.agent == "reflect":
         run_react_reflect(
@@ -233,7 +258,8 @@ if __name__ == "__main__":
             args.llm,
             workflow=args.workflow,
             generate_steps_only=args.generate_steps_only,
-            reverse=args.reverse
+            reverse=args.reverse,
+            max_workers=args.max_workers,
         )
     else:
         raise ValueError("Invalid agent choice")
@@ -17,6 +17,9 @@ class SimpleAgent(BaseAgent):
         self.tools = tools
         self.llm = llm
         self.memory = []
+        # tools are fixed at construction, so the case-insensitive dispatch
+        # table is built once instead of lowercasing every name per call
+        self._tool_by_name = {tool.name.lower(): tool for tool in tools}
 
     def execute_task(self, user_input):
         tool_descriptions = "\n".join([f"- {tool.name}: {tool.description}" for tool in self.tools])
@@ -43,8 +46,8 @@ class SimpleAgent(BaseAgent):
 
         response_dict = json_parser(response)
 
-        for tool in self.tools:
-            if tool.name.lower() == response_dict["action"].lower():
-                return tool.run(response_dict["args"])
+        tool = self._tool_by_name.get(response_dict["action"].lower())
+        if tool is not None:
+            return tool.run(response_dict["args"])
 
         return response_dict
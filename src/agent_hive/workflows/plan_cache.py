@@ -0,0 +1,40 @@
+import dbm
+import hashlib
+import os
+import shelve
+import threading
+
+_CACHE_DIR = os.path.expanduser("~/.cache/assetopsbench")
+_CACHE_PATH = os.path.join(_CACHE_DIR, "plans")
+
+# shelve's dbm backends are not safe for concurrent open; one lock
+# serializes cache access across the benchmark's worker threads.
+_CACHE_LOCK = threading.Lock()
+
+
+def plan_cache_key(task_description, agents, llm):
+    """Fingerprint of everything that determines a generated plan."""
+    agent_names = ",".join(sorted(agent.name for agent in agents))
+    raw = f"{task_description}\n{agent_names}\n{llm}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_cached_plan(key):
+    """Return the cached raw plan text for key, or None on a miss."""
+    try:
+        with _CACHE_LOCK, shelve.open(_CACHE_PATH) as cache:
+            return cache.get(key)
+    # dbm.error is already a tuple that includes OSError; wrapping it in
+    # another tuple would not flatten and breaks the except clause
+    except dbm.error:
+        return None
+
+
+def store_plan(key, plan_text):
+    """Persist the raw plan text under key; cache failures are non-fatal."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with _CACHE_LOCK, shelve.open(_CACHE_PATH) as cache:
+            cache[key] = plan_text
+    except dbm.error:
+        pass
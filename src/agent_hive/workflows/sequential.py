@@ -41,6 +41,17 @@ class SequentialWorkflow(Workflow):
         self.max_memory = 10
         self._verify_tasks()
 
+    def reset(self, tasks: List[Task]):
+        """Reuse this workflow instance for a new task list.
+
+        Keeps the configured context_type; memory is cleared so a
+        subsequent run starts fresh.
+        """
+        self.tasks = tasks
+        self.memory = []
+        self._verify_tasks()
+        return self
+
     def _verify_tasks(self):
         if not isinstance(self.tasks, list):
             raise ValueError("tasks must be a list of Task objects")
@@ -1,77 +1,245 @@
 import argparse
 import json
+import os
 import pathlib
-from typing import List, Iterator, Dict, Any
-from pydantic import ValidationError
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Iterator, Dict, Any, Optional, Tuple
+from pydantic import TypeAdapter, ValidationError
 
-from scenarios import Scenario
+try:
+    from assetopsbench.core.scenarios import Scenario
+except ImportError:  # direct script execution from the core directory
+    from scenarios import Scenario
+
+# pydantic-core compiles one validator per type; building the list adapter
+# at import time lets whole-array inputs validate in a single call.
+_SCENARIO_LIST_ADAPTER = TypeAdapter(List[Scenario])
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to stdlib json
+    _loads = json.loads
 
 def read_json_file(file_path: pathlib.Path) -> List[Dict[str, Any]]:
     """Read and parse JSON file, handling both arrays and single objects."""
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'rb') as f:
         try:
-            data = json.load(f)
+            data = _loads(f.read())
             if isinstance(data, list):
                 return data
             else:
                 return [data]
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise ValueError(f"Invalid JSON in {file_path}: {str(e)}")
 
 def read_jsonl_file(file_path: pathlib.Path) -> Iterator[Dict[str, Any]]:
-    """Read and parse JSONL file line by line."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:  # Skip empty lines
+    """Read and parse JSONL file line by line.
+
+    Records are yielded one at a time so peak memory stays at a single
+    record regardless of file size; callers must not accumulate them.
+    """
+    with open(file_path, 'rb') as f:
+        for line_num, raw in enumerate(f, 1):
+            if not raw.strip():  # Skip empty lines
                 continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError as e:
+                # the parsers accept surrounding whitespace, so the raw
+                # line is passed without allocating a stripped copy
+                yield _loads(raw)
+            except ValueError as e:
                 raise ValueError(f"Invalid JSON on line {line_num} in {file_path}: {str(e)}")
 
-def validate_scenario(data: Dict[str, Any], context: str = "") -> List[str]:
-    """Validate a single scenario object against the Scenario model."""
-    errors = []
+_REQUIRED_FIELDS = frozenset({'id', 'text'})
+_OPTIONAL_STR_FIELDS = ('uuid', 'type', 'category', 'characteristic_form', 'source')
+
+def _fast_ok(data: Any) -> bool:
+    """Cheap shape check covering every typed Scenario field.
+
+    Returns True only for dicts that full pydantic validation would also
+    accept, so skipping the model construction for them is safe.
+    """
+    if not isinstance(data, dict):
+        return False
+    if not isinstance(data.get('id'), str) or not isinstance(data.get('text'), str):
+        return False
+    for key in _OPTIONAL_STR_FIELDS:
+        value = data.get(key)
+        if value is not None and not isinstance(value, str):
+            return False
+    if not isinstance(data.get('deterministic', False), bool):
+        return False
+    if not isinstance(data.get('data', {}), dict):
+        return False
+    return True
+
+def _format_errors(context: str, error_records: List[Tuple[str, str]]) -> List[str]:
+    """Render (field, msg) error tuples into the public string format."""
+    if not error_records:
+        return []
+    return [
+        f"{context} - Field '{field}': {msg}" for field, msg in error_records
+    ]
+
+def validate_scenario(
+    data: Dict[str, Any], context: str = "", strict: bool = True
+) -> Tuple[List[str], Optional[Scenario]]:
+    """Validate a single scenario object against the Scenario model.
+
+    Returns (errors, scenario). The constructed Scenario is handed back on
+    success so callers that need the object do not pay for a second model
+    construction. With strict=False, records passing the cheap _fast_ok
+    shape check are accepted without building the model at all (scenario
+    is then None); batch callers that only want the error list use this
+    to skip pydantic on the overwhelmingly common valid case.
+
+    Errors are collected internally as (field, msg) tuples and formatted
+    into strings once at return, so the context prefix is only stitched
+    in on the failure path.
+    """
+    error_records = []
+    scenario = None
+
+    # Convert id to string if it's an integer (based on your examples)
+    if isinstance(data, dict) and isinstance(data.get('id'), int):
+        data['id'] = str(data['id'])
+
+    if not strict and _fast_ok(data):
+        return [], scenario
+
+    # A set difference on the dict keys spots missing required fields
+    # without running full model validation; the messages mirror
+    # pydantic's own "Field required" wording.
+    if isinstance(data, dict):
+        missing = _REQUIRED_FIELDS - data.keys()
+        if missing:
+            error_records = [(field, "Field required") for field in sorted(missing)]
+            return _format_errors(context, error_records), scenario
+
     try:
-        # Convert id to string if it's an integer (based on your examples)
-        if 'id' in data and isinstance(data['id'], int):
-            data['id'] = str(data['id'])
-        
-        Scenario(**data)
+        scenario = Scenario(**data)
     except ValidationError as e:
         for error in e.errors():
             field = " → ".join(str(loc) for loc in error['loc'])
-            msg = error['msg']
-            errors.append(f"{context} - Field '{field}': {msg}")
+            error_records.append((field, error['msg']))
     except Exception as e:
-        errors.append(f"{context} - Unexpected error: {str(e)}")
-    return errors
+        return [f"{context} - Unexpected error: {str(e)}"], scenario
+    return _format_errors(context, error_records), scenario
 
-def validate_file(file_path: pathlib.Path) -> List[str]:
-    """Validate all scenarios in a file."""
+def validate_scenarios(items: Iterable[Dict[str, Any]]) -> List[List[str]]:
+    """Validate a batch of scenario dicts in one pydantic-core call.
+
+    Returns one error list per item, in input order; valid items get an
+    empty list. Messages carry no location prefix ("Field 'text': ..."),
+    so callers can attach whatever context they have (file, line, index).
+    """
+    items = list(items)
+    for data in items:
+        # Convert id to string if it's an integer (based on your examples)
+        if isinstance(data, dict) and isinstance(data.get('id'), int):
+            data['id'] = str(data['id'])
+    errors_by_item: List[List[str]] = [[] for _ in items]
+    try:
+        _SCENARIO_LIST_ADAPTER.validate_python(items)
+    except ValidationError as e:
+        for error in e.errors():
+            loc = error['loc']
+            idx = int(loc[0]) if loc else 0
+            field = " → ".join(str(part) for part in loc[1:])
+            errors_by_item[idx].append(f"Field '{field}': {error['msg']}")
+    return errors_by_item
+
+def validate_file(
+    file_path: pathlib.Path, max_errors: Optional[int] = None
+) -> List[str]:
+    """Validate all scenarios in a file.
+
+    With max_errors set, validation stops as soon as that many messages
+    have been collected, so badly broken files fail fast instead of
+    being parsed to the end. The default (None) reports everything.
+    """
     errors = []
     try:
         if file_path.suffix == '.jsonl':
             # Process JSONL file
             for line_num, data in enumerate(read_jsonl_file(file_path), 1):
                 context = f"{file_path}:{line_num}"
-                errors.extend(validate_scenario(data, context))
+                record_errors, _ = validate_scenario(data, context, strict=False)
+                errors.extend(record_errors)
+                if max_errors is not None and len(errors) >= max_errors:
+                    return errors[:max_errors]
         else:
-            # Process JSON file
+            # Process JSON file; the whole array goes through the
+            # precompiled list adapter in one pydantic-core call
             data_list = read_json_file(file_path)
-            for idx, data in enumerate(data_list, 1):
-                context = f"{file_path}[{idx}]"
-                errors.extend(validate_scenario(data, context))
+            for idx, record_errors in enumerate(validate_scenarios(data_list), 1):
+                errors.extend(
+                    f"{file_path}[{idx}] - {record_error}"
+                    for record_error in record_errors
+                )
+                if max_errors is not None and len(errors) >= max_errors:
+                    return errors[:max_errors]
     except Exception as e:
         errors.append(f"{file_path} - Failed to process file: {str(e)}")
     return errors
 
+def validate_files(
+    paths: Iterable[pathlib.Path], workers: Optional[int] = None
+) -> List[str]:
+    """Validate many files in parallel across worker processes.
+
+    Each file is parsed and validated independently, which is CPU-bound
+    pydantic+JSON work, so batches fan out to a ProcessPoolExecutor for a
+    near-linear speedup with core count. chunksize amortizes the IPC
+    overhead when many small files are queued. A single file (or
+    workers=1) is validated in-process.
+    """
+    paths = list(paths)
+    if len(paths) <= 1 or workers == 1:
+        errors = []
+        for path in paths:
+            errors.extend(validate_file(path))
+        return errors
+
+    errors = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for file_errors in executor.map(validate_file, paths, chunksize=16):
+            errors.extend(file_errors)
+    return errors
+
+VALID_EXT = frozenset({'.json', '.jsonl'})
+
+def iter_json_files(directory: pathlib.Path) -> Iterator[pathlib.Path]:
+    """Yield JSON and JSONL files in a directory lazily.
+
+    Uses one os.scandir pass with a suffix-set lookup instead of two glob
+    walks, so each directory entry is stat'd and matched once; paths are
+    yielded as they are found rather than accumulated.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False) and \
+                    os.path.splitext(entry.name)[1] in VALID_EXT:
+                yield pathlib.Path(entry.path)
+
 def find_json_files(directory: pathlib.Path) -> List[pathlib.Path]:
     """Find all JSON and JSONL files in a directory."""
-    json_files = list(directory.glob("*.json"))
-    jsonl_files = list(directory.glob("*.jsonl"))
-    return json_files + jsonl_files
+    return list(iter_json_files(directory))
+
+def find_json_filenames(directory: pathlib.Path) -> List[str]:
+    """Find the names of all JSON and JSONL files in a directory.
+
+    Returns bare filenames as strings; callers that only report or match
+    names skip the pathlib.Path construction per entry.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and os.path.splitext(entry.name)[1] in VALID_EXT
+        ]
 
 def main():
     parser = argparse.ArgumentParser(
@@ -98,7 +266,7 @@ def main():
             
         for file_path in json_files:
             print(f"Validating: {file_path.name}")
-            all_errors.extend(validate_file(file_path))
+        all_errors.extend(validate_files(json_files))
     else:
         print(f"Error: Path '{args.path}' does not exist.")
         return
@@ -0,0 +1,16 @@
+"""Shared import-path setup for the test modules.
+
+Importing this module makes the core modules importable by name
+(``from validator import ...``) and the src packages importable
+(``agent_hive``); the paths are stitched together once here instead of
+at the top of every test file.
+"""
+
+import sys
+from pathlib import Path
+
+_SRC_DIR = str(Path(__file__).resolve().parents[2])
+_CORE_DIR = str(Path(__file__).resolve().parents[1] / "core")
+for _dir in (_SRC_DIR, _CORE_DIR):
+    if _dir not in sys.path:
+        sys.path.insert(0, _dir)
@@ -0,0 +1,51 @@
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_all_tests(jobs=None):
+    """Run the test suite under this directory.
+
+    The test classes are independent and mostly I/O-bound, so when
+    unittest-parallel is installed and more than one job is requested the
+    discovery run is handed off to it for a per-core speedup; otherwise the
+    serial TextTestRunner is used.
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    if jobs > 1 and shutil.which("unittest-parallel"):
+        return subprocess.call(
+            [
+                "unittest-parallel",
+                "-s",
+                TESTS_DIR,
+                "-p",
+                "test_*.py",
+                "-j",
+                str(jobs),
+            ]
+        )
+
+    suite = unittest.defaultTestLoader.discover(TESTS_DIR, pattern="test_*.py")
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the assetopsbench tests.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of parallel test processes (default: CPU count).",
+    )
+    args = parser.parse_args()
+    sys.exit(run_all_tests(jobs=args.jobs))
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import _bootstrap  # noqa: F401  (single shared sys.path setup)
+
+from agent_hive.workflows import plan_cache  # noqa: E402
+
+
+class TestPlanCache(unittest.TestCase):
+    """Unit tests for the on-disk plan cache."""
+
+    def test_get_cached_plan_missing_cache_dir(self):
+        # Regression test: the first planning call reads the cache before
+        # anything has created the cache directory; a miss must fall
+        # through to None, not raise.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = os.path.join(tmpdir, "does-not-exist", "plans")
+            with mock.patch.object(plan_cache, "_CACHE_PATH", missing):
+                self.assertIsNone(plan_cache.get_cached_plan("some-key"))
+
+    def test_store_and_get_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, "cache")
+            cache_path = os.path.join(cache_dir, "plans")
+            with mock.patch.object(plan_cache, "_CACHE_DIR", cache_dir), \
+                    mock.patch.object(plan_cache, "_CACHE_PATH", cache_path):
+                self.assertIsNone(plan_cache.get_cached_plan("key"))
+                plan_cache.store_plan("key", "plan text")
+                self.assertEqual(plan_cache.get_cached_plan("key"), "plan text")
+
+
+if __name__ == "__main__":
+    unittest.main()
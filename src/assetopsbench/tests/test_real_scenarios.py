@@ -0,0 +1,88 @@
+import itertools
+import json
+import unittest
+from pathlib import Path
+
+import _bootstrap  # noqa: F401  (single shared sys.path setup)
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to stdlib json
+    _loads = json.loads
+
+from validator import validate_file, validate_scenario  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCENARIO_DIR = REPO_ROOT / "scenarios"
+SINGLE_AGENT_DIR = SCENARIO_DIR / "single_agent"
+MULTI_AGENT_DIR = SCENARIO_DIR / "multi_agent"
+ALL_UTTERANCES_JSONL = SCENARIO_DIR / "all_utterance.jsonl"
+
+
+class TestRealScenarioFiles(unittest.TestCase):
+    """Validate the scenario files shipped with the benchmark against the
+    Scenario schema."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Several test methods look at the same files; parse and validate
+        # each file once per class instead of once per method.
+        cls._validation_errors = {}
+        cls._scenarios_by_file = {}
+
+    @classmethod
+    def _file_errors(cls, file_path):
+        if file_path not in cls._validation_errors:
+            cls._validation_errors[file_path] = validate_file(file_path)
+        return cls._validation_errors[file_path]
+
+    @classmethod
+    def _load_scenarios(cls, file_path):
+        if file_path not in cls._scenarios_by_file:
+            with open(file_path, "rb") as f:
+                cls._scenarios_by_file[file_path] = _loads(f.read())
+        return cls._scenarios_by_file[file_path]
+
+    def _assert_file_valid(self, file_path):
+        self.assertTrue(file_path.exists(), f"Missing scenario file: {file_path}")
+        errors = self._file_errors(file_path)
+        self.assertEqual(errors, [], f"{file_path} failed validation: {errors}")
+
+    def test_iot_scenarios_validation(self):
+        self._assert_file_valid(SINGLE_AGENT_DIR / "iot_utterance_meta.json")
+
+    def test_fmsr_scenarios_validation(self):
+        self._assert_file_valid(SINGLE_AGENT_DIR / "fmsr_utterance.json")
+
+    def test_tsfm_scenarios_validation(self):
+        self._assert_file_valid(SINGLE_AGENT_DIR / "tsfm_utterance.json")
+
+    def test_workorder_scenarios_validation(self):
+        self._assert_file_valid(SINGLE_AGENT_DIR / "wo_utterance.json")
+
+    def test_end2end_scenarios_validation(self):
+        self._assert_file_valid(MULTI_AGENT_DIR / "end2end_utterance.json")
+
+    def test_all_utterances_jsonl_validation(self):
+        # Stream the JSONL head instead of reading the whole file; only the
+        # first few records are inspected here.
+        with open(ALL_UTTERANCES_JSONL, "rb") as f:
+            for line_num, line in enumerate(itertools.islice(f, 5), 1):
+                data = _loads(line)
+                errors, _ = validate_scenario(data, f"all_utterance.jsonl:{line_num}")
+                self.assertEqual(errors, [], f"line {line_num} failed: {errors}")
+
+    def test_scenario_types_and_categories(self):
+        scenarios = self._load_scenarios(SINGLE_AGENT_DIR / "iot_utterance_meta.json")
+        self.assertGreater(len(scenarios), 0)
+        types = {scenario.get("type") for scenario in scenarios}
+        self.assertIn("IoT", types)
+        for scenario in scenarios:
+            self.assertIn("text", scenario)
+            self.assertIn("category", scenario)
+
+
+if __name__ == "__main__":
+    unittest.main()
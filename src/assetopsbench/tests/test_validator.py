@@ -0,0 +1,168 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import _bootstrap  # noqa: F401  (single shared sys.path setup)
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps  # serializes straight to bytes
+except ImportError:  # orjson is optional; fall back to stdlib json
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+from scenarios import Scenario  # noqa: E402
+from validator import (  # noqa: E402
+    find_json_filenames,
+    find_json_files,
+    validate_file,
+    validate_files,
+    validate_scenario,
+    validate_scenarios,
+)
+
+
+def setUpModule():
+    # warmup: building one model here pushes pydantic-core's lazy schema
+    # compilation out of the first timed test
+    Scenario(id="0", text="warm")
+
+
+# Fixture dicts are built once at import; tests that need variations
+# derive them with merge literals instead of copy()+update() calls.
+VALID_SCENARIO = {
+    "id": "1",
+    "type": "IoT",
+    "text": "What IoT sites are available?",
+    "category": "Knowledge Query",
+    "characteristic_form": "The expected response should be the return value of all sites",
+}
+TSFM_SCENARIO = {
+    "id": "201",
+    "type": "TSFM",
+    "text": "What types of time series analysis are supported?",
+    "category": "Knowledge Query",
+    "characteristic_form": "The expected response should list the supported analyses",
+}
+# 10k-char payload for the long characteristic_form test, built once
+_LONG_STR = "x" * 10000
+WITH_OPTIONALS = {
+    **VALID_SCENARIO,
+    "uuid": "test-uuid-123",
+    "deterministic": True,
+    "expected_result": {"sites": ["MAIN"]},
+    "data": {"asset": "Chiller 6"},
+    "source": "test_dataset.json",
+}
+
+
+class TestScenarioValidation(unittest.TestCase):
+    """Unit tests for the Scenario schema and the validator helpers."""
+
+    @classmethod
+    def setUpClass(cls):
+        # The file-level tests only read their fixtures, so one shared
+        # tempdir written once per class replaces per-test tempfile churn.
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        tmp_path = Path(cls._tmpdir.name)
+        cls._valid_json = tmp_path / "valid.json"
+        cls._valid_json.write_bytes(_dumps([VALID_SCENARIO, TSFM_SCENARIO]))
+        cls._valid_jsonl = tmp_path / "valid.jsonl"
+        cls._valid_jsonl.write_bytes(
+            _dumps(VALID_SCENARIO) + b"\n" + _dumps(TSFM_SCENARIO) + b"\n"
+        )
+        cls._invalid_json = tmp_path / "invalid.json"
+        cls._invalid_json.write_text("this is not json")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmpdir.cleanup()
+
+    def test_valid_scenario(self):
+        errors, scenario = validate_scenario({**VALID_SCENARIO})
+        self.assertEqual(errors, [])
+        self.assertIsNotNone(scenario)
+
+    def test_valid_tsfm_scenario(self):
+        errors, scenario = validate_scenario({**TSFM_SCENARIO})
+        self.assertEqual(errors, [])
+        # the validated model is returned, so no second construction
+        self.assertEqual(scenario.type, "TSFM")
+
+    def test_scenario_with_optional_fields(self):
+        errors, _ = validate_scenario({**WITH_OPTIONALS})
+        self.assertEqual(errors, [])
+
+    def test_scenario_with_integer_id(self):
+        # integer ids occur in the shipped files and are coerced to strings
+        errors, scenario = validate_scenario({**VALID_SCENARIO, "id": 113})
+        self.assertEqual(errors, [])
+        self.assertEqual(scenario.id, "113")
+
+    def test_invalid_scenario_missing_required_fields(self):
+        errors, scenario = validate_scenario({"id": "1"})
+        self.assertTrue(errors)
+        self.assertIsNone(scenario)
+        self.assertTrue(any("text" in error.lower() for error in errors))
+
+    def test_characteristic_form_validation(self):
+        errors, _ = validate_scenario(
+            {**VALID_SCENARIO, "characteristic_form": _LONG_STR}
+        )
+        self.assertEqual(errors, [])
+
+    def test_validate_scenarios_batch(self):
+        results = validate_scenarios([{**VALID_SCENARIO}, {**TSFM_SCENARIO}])
+        self.assertEqual(results, [[], []])
+
+    def test_validate_scenarios_batch_reports_per_item(self):
+        results = validate_scenarios([{**VALID_SCENARIO}, {"id": "2"}])
+        self.assertEqual(results[0], [])
+        self.assertTrue(any("text" in error.lower() for error in results[1]))
+
+    def test_validate_json_file(self):
+        errors = validate_file(self._valid_json)
+        self.assertEqual(errors, [])
+
+    def test_validate_jsonl_file(self):
+        errors = validate_file(self._valid_jsonl)
+        self.assertEqual(errors, [])
+
+    def test_validate_invalid_json_file(self):
+        errors = validate_file(self._invalid_json)
+        self.assertTrue(errors)
+
+    def test_validate_file_max_errors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bad_jsonl = Path(tmpdir) / "bad.jsonl"
+            bad_jsonl.write_bytes(_dumps({"id": "1"}) + b"\n" + _dumps({"id": "2"}) + b"\n")
+            self.assertEqual(len(validate_file(bad_jsonl)), 2)
+            self.assertEqual(len(validate_file(bad_jsonl, max_errors=1)), 1)
+
+    def test_validate_files_parallel(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            (tmp_path / "a.json").write_bytes(_dumps([VALID_SCENARIO]))
+            (tmp_path / "b.jsonl").write_bytes(_dumps(TSFM_SCENARIO) + b"\n")
+            errors = validate_files(find_json_files(tmp_path), workers=2)
+            self.assertEqual(errors, [])
+
+    def test_find_json_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            (tmp_path / "a.json").write_text("[]")
+            (tmp_path / "b.jsonl").write_text("")
+            (tmp_path / "c.txt").write_text("not a scenario file")
+            json_files = find_json_files(tmp_path)
+            self.assertEqual(len(json_files), 2)
+            names = sorted(f.name for f in json_files)
+            self.assertEqual(names, ["a.json", "b.jsonl"])
+            # the filename variant skips Path construction entirely
+            self.assertEqual(sorted(find_json_filenames(tmp_path)), names)
+
+
+if __name__ == "__main__":
+    unittest.main()